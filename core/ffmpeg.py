@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
 import subprocess
+import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +16,21 @@ VIDEO_EXTENSIONS = {".mp4", ".mov", ".mkv", ".avi"}
 LOGO_EXTENSIONS = {".png", ".webp"}
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
 
+HWACCEL_MODES = ("none", "auto", "cuda", "vaapi", "qsv")
+HWACCEL_SCALE_FILTERS = {"cuda": "scale_cuda", "vaapi": "scale_vaapi", "qsv": "scale_qsv"}
+
+# Windows: no console window per ffmpeg/ffprobe spawn, and keep encoders from
+# competing with the GUI thread for CPU.
+# POSIX: subprocess only takes the posix_spawn() fast path (no fork of this
+# large process) with close_fds=False, an executable that contains a directory,
+# and no preexec_fn/start_new_session/process_group. Our fds are non-inheritable
+# by default (PEP 446), so close_fds=False is safe. Do not add preexec_fn or
+# process_group to ffmpeg/ffprobe spawns: that silently falls back to fork+exec.
+if os.name == "nt":
+    POPEN_KWARGS: dict = {"creationflags": subprocess.CREATE_NO_WINDOW | subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+else:
+    POPEN_KWARGS = {"close_fds": False}
+
 LOGO_LEFT = 1750
 LOGO_TOP = 1040
 LOGO_WIDTH = 140
@@ -72,14 +90,39 @@ def is_image_file(path: Path) -> bool:
     return path.suffix.lower() in IMAGE_EXTENSIONS
 
 
+@functools.lru_cache(maxsize=16)
+def _which_cached(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=16)
 def detect_ffmpeg() -> Optional[str]:
-    return shutil.which("ffmpeg")
+    return _which_cached("ffmpeg")
 
 
+@functools.lru_cache(maxsize=16)
 def detect_ffprobe() -> Optional[str]:
-    return shutil.which("ffprobe")
+    return _which_cached("ffprobe")
+
+
+def spawn_kwargs(command: list[str]) -> dict:
+    """Popen/run keyword arguments for an ffmpeg/ffprobe command (see POPEN_KWARGS)."""
+    kwargs = dict(POPEN_KWARGS)
+    if os.name != "nt" and not os.path.dirname(command[0]):
+        resolved = _which_cached(command[0])
+        if resolved:
+            kwargs["executable"] = resolved
+    return kwargs
+
 
+def clear_binary_cache() -> None:
+    """Forget cached PATH lookups, e.g. after the user installs or picks another ffmpeg."""
+    _which_cached.cache_clear()
+    detect_ffmpeg.cache_clear()
+    detect_ffprobe.cache_clear()
 
+
+@functools.lru_cache(maxsize=4)
 def ffprobe_from_ffmpeg(ffmpeg_path: str) -> str:
     ffmpeg = Path(ffmpeg_path)
     if ffmpeg.name.lower().startswith("ffmpeg"):
@@ -88,31 +131,83 @@ def ffprobe_from_ffmpeg(ffmpeg_path: str) -> str:
 
 
 def validate_binaries(ffmpeg_path: str, ffprobe_path: str) -> tuple[bool, str]:
-    if not shutil.which(ffmpeg_path) and not Path(ffmpeg_path).exists():
+    if not _which_cached(ffmpeg_path) and not Path(ffmpeg_path).exists():
         return False, f"ffmpeg not found: {ffmpeg_path}"
-    if not shutil.which(ffprobe_path) and not Path(ffprobe_path).exists():
+    if not _which_cached(ffprobe_path) and not Path(ffprobe_path).exists():
         return False, f"ffprobe not found: {ffprobe_path}"
     return True, ""
 
 
-def probe_duration(ffprobe_path: str, input_path: str) -> float:
+# Stop ffprobe after a short scan window instead of walking the whole file;
+# most containers carry format=duration in the header.
+_PROBE_SCAN_LIMITS = ["-analyzeduration", "1M", "-probesize", "5M"]
+
+
+def _run_probe(ffprobe_path: str, path: str, limited: bool) -> tuple[Optional[float], bool]:
     cmd = [
         ffprobe_path,
         "-v",
         "error",
-        "-show_entries",
-        "format=duration",
+        *(_PROBE_SCAN_LIMITS if limited else []),
+        "-show_format",
+        "-show_streams",
         "-of",
-        "default=noprint_wrappers=1:nokey=1",
-        input_path,
+        "json",
+        path,
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False, **spawn_kwargs(cmd))
+    scan = "limited scan" if limited else "full scan"
     if result.returncode != 0:
-        raise FFmpegError(result.stderr.strip() or "ffprobe failed")
+        raise FFmpegError(result.stderr.strip() or f"ffprobe failed ({scan})")
     try:
-        return float(result.stdout.strip())
+        payload = json.loads(result.stdout)
     except ValueError as exc:
-        raise FFmpegError("Could not parse duration from ffprobe output") from exc
+        raise FFmpegError(f"Could not parse ffprobe output ({scan})") from exc
+
+    try:
+        duration: Optional[float] = float(payload.get("format", {})["duration"])
+    except (KeyError, TypeError, ValueError):
+        duration = None
+    has_audio = any(stream.get("codec_type") == "audio" for stream in payload.get("streams", []))
+    return duration, has_audio
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(ffprobe_path: str, path: str, size: int, mtime: float) -> tuple[Optional[float], bool]:
+    """Single ffprobe call for (duration, has_audio); immutable since every caller shares it.
+
+    size/mtime are part of the cache key only, so a rewritten file is probed again.
+    The probe first runs with a capped scan window and falls back to a full scan
+    once if that yields no duration or no audio stream (TS/AVI audio can start
+    past the window; a miss there would silently skip audio extraction).
+    """
+    try:
+        duration, has_audio = _run_probe(ffprobe_path, path, limited=True)
+    except FFmpegError:
+        duration, has_audio = None, False
+    if duration is None or not has_audio:
+        duration, has_audio = _run_probe(ffprobe_path, path, limited=False)
+    return duration, has_audio
+
+
+def _probe(ffprobe_path: str, input_path: str) -> tuple[Optional[float], bool]:
+    try:
+        stat = os.stat(input_path)
+    except OSError as exc:
+        raise FFmpegError(f"Cannot read input file: {input_path}") from exc
+    return _probe_cached(ffprobe_path, input_path, stat.st_size, stat.st_mtime)
+
+
+def probe_duration(ffprobe_path: str, input_path: str) -> float:
+    duration, _has_audio = _probe(ffprobe_path, input_path)
+    if duration is None:
+        raise FFmpegError("Could not parse duration from ffprobe output (limited and full scan)")
+    return duration
+
+
+def probe_file(ffprobe_path: str, input_path: str) -> tuple[float, bool]:
+    """Return (duration, has_audio) for input_path from a single ffprobe call."""
+    return probe_duration(ffprobe_path, input_path), has_audio_stream(ffprobe_path, input_path)
 
 
 def probe_video_size(ffprobe_path: str, input_path: str) -> tuple[int, int]:
@@ -128,7 +223,7 @@ def probe_video_size(ffprobe_path: str, input_path: str) -> tuple[int, int]:
         "json",
         input_path,
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False, **spawn_kwargs(cmd))
     if result.returncode != 0:
         raise FFmpegError(result.stderr.strip() or "ffprobe size probe failed")
 
@@ -146,53 +241,59 @@ def probe_video_size(ffprobe_path: str, input_path: str) -> tuple[int, int]:
 
 
 def has_audio_stream(ffprobe_path: str, input_path: str) -> bool:
-    cmd = [
-        ffprobe_path,
-        "-v",
-        "error",
-        "-select_streams",
-        "a",
-        "-show_entries",
-        "stream=index",
-        "-of",
-        "csv=p=0",
-        input_path,
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if result.returncode != 0:
+    try:
+        _duration, has_audio = _probe(ffprobe_path, input_path)
+    except FFmpegError:
         return False
-    return bool(result.stdout.strip())
+    return has_audio
+
+
+# Windows and macOS filesystems are case-insensitive by default: "Lecture" and
+# "lecture" are the same folder there, so collision checks must compare folded names.
+_CASE_INSENSITIVE_FS = os.name == "nt" or sys.platform == "darwin"
+
+
+def _fold_name(name: str) -> str:
+    return name.casefold() if _CASE_INSENSITIVE_FS else name
+
+
+def _existing_names(parent: Path) -> set[str]:
+    """List parent once so collision checks are set lookups, not one stat per candidate."""
+    try:
+        with os.scandir(parent) as entries:
+            return {_fold_name(entry.name) for entry in entries}
+    except OSError:
+        return set()
 
 
 def make_unique_path(path: Path) -> Path:
-    if not path.exists():
+    existing = _existing_names(path.parent)
+    if _fold_name(path.name) not in existing:
         return path
     stem = path.stem
     suffix = path.suffix
-    parent = path.parent
     index = 1
     while True:
-        candidate = parent / f"{stem}_{index:02d}{suffix}"
-        if not candidate.exists():
-            return candidate
+        candidate_name = f"{stem}_{index:02d}{suffix}"
+        if _fold_name(candidate_name) not in existing:
+            return path.parent / candidate_name
         index += 1
 
 
 def make_unique_dir(path: Path) -> Path:
-    if not path.exists():
+    existing = _existing_names(path.parent)
+    if _fold_name(path.name) not in existing:
         return path
     index = 1
     while True:
-        candidate = path.parent / f"{path.name}_{index:02d}"
-        if not candidate.exists():
-            return candidate
+        candidate_name = f"{path.name}_{index:02d}"
+        if _fold_name(candidate_name) not in existing:
+            return path.parent / candidate_name
         index += 1
 
 
-def resolve_output_root(input_path: str, options: ProcessingOptions) -> Path:
-    if options.save_next_to_input:
-        return Path(input_path).parent
-    if options.output_folder:
+def resolve_output_root(input_path: str | Path, options: ProcessingOptions) -> Path:
+    if options.output_folder and not options.save_next_to_input:
         return Path(options.output_folder)
     return Path(input_path).parent
 
@@ -211,7 +312,7 @@ def build_overlay_command(
         f"[0:v][lg]overlay={logo_left}:{logo_top}:format=auto[v]"
     )
 
-    return [
+    cmd = [
         options.ffmpeg_path,
         overwrite_flag,
         "-i",
@@ -234,6 +335,7 @@ def build_overlay_command(
         "copy",
         output_file,
     ]
+    return with_thread_cap(options, cmd)
 
 
 def build_delogo_overlay_command(
@@ -251,7 +353,7 @@ def build_delogo_overlay_command(
         f"[v0][lg]overlay={logo_left}:{logo_top}:format=auto[v]"
     )
 
-    return [
+    cmd = [
         options.ffmpeg_path,
         overwrite_flag,
         "-i",
@@ -274,6 +376,7 @@ def build_delogo_overlay_command(
         "copy",
         output_file,
     ]
+    return with_thread_cap(options, cmd)
 
 
 def build_frame_replace_command(
@@ -342,7 +445,7 @@ def build_frame_replace_command(
         command += ["-c:a", "aac", "-b:a", "192k"]
 
     command.append(output_file)
-    return command
+    return with_thread_cap(options, command)
 
 
 def build_extract_frame_preview_command(
@@ -371,24 +474,26 @@ def build_audio_command(
     force_transcode: bool = False,
 ) -> list[str]:
     overwrite_flag = "-y" if options.overwrite_existing else "-n"
-    cmd = [options.ffmpeg_path, overwrite_flag, "-i", input_path, "-vn"]
+    cmd = [options.ffmpeg_path, overwrite_flag, "-i", input_path, "-map", "0:a:0"]
+    cmd += _audio_codec_args(options, force_transcode)
+    cmd.append(output_file)
+    return with_thread_cap(options, cmd)
 
+
+def _audio_codec_args(options: ProcessingOptions, force_transcode: bool = False) -> list[str]:
     fmt = options.audio_format
     mode = options.audio_mode
 
     if fmt == "m4a":
         if mode == "copy" and not force_transcode:
-            cmd += ["-acodec", "copy", output_file]
-        else:
-            cmd += ["-codec:a", "aac", "-b:a", "192k", output_file]
-    elif fmt == "mp3":
-        cmd += ["-codec:a", "libmp3lame", "-q:a", "2", output_file]
-    elif fmt == "wav":
-        cmd += ["-ac", "2", "-ar", "44100", output_file]
-    else:
-        raise FFmpegError(f"Unsupported audio format: {fmt}")
-
-    return cmd
+            # Stream copy of the mapped audio track; faststart moves the moov atom up front.
+            return ["-c:a", "copy", "-movflags", "+faststart"]
+        return ["-codec:a", "aac", "-b:a", "192k"]
+    if fmt == "mp3":
+        return ["-vn", "-codec:a", "libmp3lame", "-q:a", "2"]
+    if fmt == "wav":
+        return ["-vn", "-ac", "2", "-ar", "44100"]
+    raise FFmpegError(f"Unsupported audio format: {fmt}")
 
 
 def build_frames_command(
@@ -400,24 +505,114 @@ def build_frames_command(
     overwrite_flag = "-y" if options.overwrite_existing else "-n"
     interval = frame_interval_sec or options.frame_interval_sec
     fps_filter = f"fps=1/{interval}"
+    hwaccel = options.hwaccel if options.hwaccel in HWACCEL_MODES else "none"
 
-    if options.resize_mode == "1280w":
-        vf = f"{fps_filter},scale=1280:-1"
-    elif options.resize_mode == "1920w":
-        vf = f"{fps_filter},scale=1920:-1"
-    else:
+    width = {"1280w": 1280, "1920w": 1920}.get(options.resize_mode)
+    hwaccel_args: list[str] = []
+    if hwaccel != "none":
+        hwaccel_args = ["-hwaccel", hwaccel]
+
+    if width is None:
         vf = fps_filter
+    elif hwaccel in HWACCEL_SCALE_FILTERS:
+        # Keep frames on the GPU for scaling, then download for the image encoder.
+        hwaccel_args += ["-hwaccel_output_format", hwaccel]
+        vf = f"{fps_filter},{HWACCEL_SCALE_FILTERS[hwaccel]}={width}:-1,hwdownload,format=nv12"
+    else:
+        vf = f"{fps_filter},scale={width}:-1"
 
-    return [
+    cmd = [
         options.ffmpeg_path,
         overwrite_flag,
+        *hwaccel_args,
         "-i",
         input_path,
         "-vf",
         vf,
+        *_frame_output_args(options),
         output_pattern,
     ]
+    return with_thread_cap(options, cmd)
+
+
+def _frame_output_args(options: ProcessingOptions) -> list[str]:
+    if options.frame_format == "jpg":
+        return ["-q:v", str(options.frame_quality), "-vsync", "vfr"]
+    return ["-compression_level", "3"]
+
+
+def build_combined_command(
+    options: ProcessingOptions,
+    input_path: str,
+    audio_output: str,
+    frames_pattern: str,
+    frame_interval_sec: int | None = None,
+    force_transcode: bool = False,
+) -> list[str]:
+    """Extract frames and audio from a single decode pass of input_path."""
+    overwrite_flag = "-y" if options.overwrite_existing else "-n"
+    interval = frame_interval_sec or options.frame_interval_sec
+    width = {"1280w": 1280, "1920w": 1920}.get(options.resize_mode)
+    video_graph = f"[0:v]fps=1/{interval}"
+    if width is not None:
+        video_graph += f",scale={width}:-1"
+    video_graph += "[frames]"
+
+    cmd = [
+        options.ffmpeg_path,
+        overwrite_flag,
+        "-i",
+        input_path,
+        "-filter_complex",
+        video_graph,
+        "-map",
+        "[frames]",
+        *_frame_output_args(options),
+        # Output options apply per output: the frames output needs its own cap too.
+        *_thread_args(options),
+        frames_pattern,
+        "-map",
+        "0:a:0",
+        *_audio_codec_args(options, force_transcode),
+        audio_output,
+    ]
+    return with_thread_cap(options, cmd)
+
+
+def with_thread_cap(options: ProcessingOptions, cmd: list[str]) -> list[str]:
+    """Cap ffmpeg threads for parallel jobs when options.ffmpeg_threads is set.
+
+    ``-threads N`` is inserted after the overwrite flag (input/decoder threads)
+    and right before the output file (encoder/filter threads). Expects the
+    ``[ffmpeg, -y|-n, ..., output]`` layout every builder in this project uses.
+    """
+    threads = _thread_args(options)
+    if not threads:
+        return cmd
+    return cmd[:2] + threads + cmd[2:-1] + threads + cmd[-1:]
+
+
+def _thread_args(options: ProcessingOptions) -> list[str]:
+    if options.ffmpeg_threads <= 0:
+        return []
+    return ["-threads", str(options.ffmpeg_threads)]
+
+
+_known_dirs: set[str] = set()
+_known_dirs_lock = threading.Lock()
 
 
 def ensure_output_dir(path: Path) -> None:
+    key = str(path)
+    with _known_dirs_lock:
+        if key in _known_dirs:
+            return
     os.makedirs(path, exist_ok=True)
+    with _known_dirs_lock:
+        _known_dirs.add(key)
+
+
+def clear_output_dir_cache() -> None:
+    """Forget directories seen by ensure_output_dir (they may be deleted between runs)."""
+    with _known_dirs_lock:
+        _known_dirs.clear()
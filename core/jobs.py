@@ -24,7 +24,7 @@ class JobStatus(str, Enum):
     CANCELLED = "Cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingOptions:
     ffmpeg_path: str = "ffmpeg"
     ffprobe_path: str = "ffprobe"
@@ -39,7 +39,9 @@ class ProcessingOptions:
     extract_frames: bool = True
     frame_interval_sec: int = 10
     frame_format: str = "jpg"  # jpg|png
+    frame_quality: int = 3  # mjpeg -q:v, 2 (best) .. 31
     resize_mode: str = "original"  # original|1280w|1920w
+    hwaccel: str = "none"  # none|auto|cuda|vaapi|qsv
 
     logo_path: str = ""
     remove_old_logo: bool = True
@@ -48,8 +50,11 @@ class ProcessingOptions:
     logo_width: int = 140
     logo_height: int = 40
 
+    pool_size: int = 0  # 0 = auto (cpu_count // ffmpeg_threads)
+    ffmpeg_threads: int = 0  # 0 = let ffmpeg decide
 
-@dataclass
+
+@dataclass(slots=True)
 class Job:
     input_path: str
     status: JobStatus = JobStatus.QUEUED
@@ -57,10 +62,14 @@ class Job:
     output_path: str = ""
     outputs: List[str] = field(default_factory=list)
     error_message: str = ""
+    _filename: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        self._filename = Path(self.input_path).name
 
     @property
     def filename(self) -> str:
-        return Path(self.input_path).name
+        return self._filename
 
 
 @dataclass
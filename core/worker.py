@@ -1,31 +1,43 @@
 from __future__ import annotations
 
 import logging
+import os
+import queue
+import re
+import selectors
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from core.ffmpeg import (
     FFmpegError,
     build_audio_command,
+    build_combined_command,
     build_delogo_overlay_command,
     build_frame_replace_command,
     build_frames_command,
     build_overlay_command,
+    clear_output_dir_cache,
     ensure_output_dir,
     fit_logo_rect,
-    has_audio_stream,
     is_logo_file,
     make_unique_dir,
-    probe_duration,
+    probe_file,
     probe_video_size,
     resolve_output_root,
+    spawn_kwargs,
     validate_binaries,
+    with_thread_cap,
 )
 from core.jobs import FrameReplaceJob, Job, JobStatus, ProcessingOptions, SlideVideoJob
 from core.jobs import PomodoroVideoJob
@@ -63,11 +75,59 @@ from core.pomodoro.defaults import (
 
 class WorkerSignals(QObject):
     log = pyqtSignal(str)
-    job_updated = pyqtSignal(int, object)
+    # row, status text, progress percent, output path: primitives only across threads.
+    job_updated = pyqtSignal(int, str, int, str)
     queue_progress = pyqtSignal(int, int)
     finished = pyqtSignal(dict)
 
 
+PROGRESS_EMIT_INTERVAL_SEC = 0.1
+OUTPUT_POLL_INTERVAL_SEC = 0.05
+_PROGRESS_RE = re.compile(rb"^(out_time_ms|progress)=(\S+)")
+
+
+class _ParallelProgress:
+    """Combines progress of concurrently running steps into one job ratio."""
+
+    def __init__(self, offset: float, weight: float, steps: list[str]):
+        self._offset = offset
+        self._weight = weight
+        self._ratios = {step: 0.0 for step in steps}
+        self._lock = threading.Lock()
+
+    def step(self, name: str) -> Callable[[float], float]:
+        def to_job_ratio(stage_ratio: float) -> float:
+            with self._lock:
+                self._ratios[name] = stage_ratio
+                mean_ratio = sum(self._ratios.values()) / len(self._ratios)
+            return self._offset + mean_ratio * self._weight
+
+        return to_job_ratio
+
+
+class _ProgressFileTail:
+    """Incrementally reads complete lines that ffmpeg appends to a -progress file."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._buffer = bytearray()
+
+    def poll(self) -> list[bytes]:
+        chunk = self._file.read()
+        if not chunk:
+            return []
+        self._buffer += chunk
+        *lines, rest = self._buffer.split(b"\n")
+        self._buffer = bytearray(rest)
+        return lines
+
+    def close(self) -> None:
+        self._file.close()
+
+
+ExtractionStep = tuple[str, Callable[[Optional[Callable[[float], float]]], None]]
+
+
 class ProcessingWorker(QObject):
     def __init__(self, jobs: list[Job], options: ProcessingOptions):
         super().__init__()
@@ -75,7 +135,15 @@ class ProcessingWorker(QObject):
         self.options = options
         self.signals = WorkerSignals()
         self._stop_requested = False
-        self._current_process: Optional[subprocess.Popen[str]] = None
+        self._current_process: list[subprocess.Popen[bytes]] = []
+        self._process_lock = threading.Lock()
+        self._counts_lock = threading.Lock()
+        self._dir_lock = threading.Lock()
+        self._counts = {"ok": 0, "error": 0, "cancelled": 0}
+        self._finished_jobs = 0
+        self._total_jobs = 0
+        # Per-job (monotonic timestamp, progress) of the last throttled job_updated emit.
+        self._last_progress_emit: dict[int, tuple[float, int]] = {}
         self._last_ffmpeg_error: str = ""
 
         self._logger = logging.getLogger("video_splitter")
@@ -88,70 +156,127 @@ class ProcessingWorker(QObject):
 
     @pyqtSlot()
     def run(self) -> None:
+        """Process the queue inline on the calling thread and block until done (used by --test-run).
+
+        Running on the caller keeps signal delivery direct, so plain callables connected
+        without a Qt event loop still see every log line and the summary.
+        """
+        if not self._prepare_run():
+            return
+        for idx, job in enumerate(self.jobs[: self._total_jobs]):
+            self._run_job(idx, job)
+
+    def start(self) -> Optional[ThreadPoolExecutor]:
+        """Submit the queue to the job pool and return without waiting.
+
+        ``finished`` is emitted by whichever pool thread completes the last job, so the
+        GUI needs no dedicated worker thread; signals reach it as queued connections.
+        """
+        if not self._prepare_run():
+            return None
+
+        pool_size = self._pool_size()
+        if self.options.ffmpeg_threads and pool_size < self.options.pool_size:
+            # Fewer jobs than requested workers: split the cores over the jobs that actually run.
+            cpu_count = os.cpu_count() or 1
+            threads = max(1, cpu_count // pool_size) if pool_size > 1 else 0
+            self.options = replace(self.options, ffmpeg_threads=threads)
+        if pool_size > 1:
+            self._log(f"Processing {self._total_jobs} jobs with {pool_size} parallel workers")
+        pool = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="ffmpeg-job")
+        for idx, job in enumerate(self.jobs[: self._total_jobs]):
+            pool.submit(self._run_job, idx, job)
+        # Already-submitted jobs keep running; this only releases the threads once idle.
+        pool.shutdown(wait=False)
+        return pool
+
+    def _prepare_run(self) -> bool:
+        """Validate inputs and reset counters; False (with ``finished`` emitted) if nothing should run."""
+        clear_output_dir_cache()
         ok, error_text = validate_binaries(self.options.ffmpeg_path, self.options.ffprobe_path)
         if not ok:
             self._log(error_text)
             self.signals.finished.emit({"ok": 0, "error": len(self.jobs), "cancelled": 0})
-            return
+            return False
 
         if self._has_logo_jobs():
             logo_path = Path(self.options.logo_path)
             if not logo_path.exists() or not is_logo_file(logo_path):
                 self._log("Logo file is not selected or has unsupported format (PNG/WEBP)")
                 self.signals.finished.emit({"ok": 0, "error": len(self.jobs), "cancelled": 0})
-                return
+                return False
+
+        self._counts = {"ok": 0, "error": 0, "cancelled": 0}
+        self._finished_jobs = 0
+        # Snapshot: rows added to the shared list while running are not part of this run.
+        self._total_jobs = len(self.jobs)
+        if not self._total_jobs:
+            self.signals.finished.emit(dict(self._counts))
+            return False
+        return True
+
+    def _pool_size(self) -> int:
+        if not self._total_jobs:
+            return 1
+        if self.options.pool_size > 0:
+            return min(self._total_jobs, self.options.pool_size)
+        cpu_count = os.cpu_count() or 1
+        threads_per_ffmpeg = self.options.ffmpeg_threads or cpu_count
+        return min(self._total_jobs, max(1, cpu_count // threads_per_ffmpeg))
+
+    def _run_job(self, idx: int, job: Job) -> None:
+        if self._stop_requested:
+            job.status = JobStatus.CANCELLED
+            self._emit_job(idx, job)
+            self._count_job("cancelled")
+            return
 
-        done_count = 0
-        error_count = 0
-        cancelled_count = 0
+        try:
+            if isinstance(job, FrameReplaceJob):
+                self._process_frame_replace_job(idx, job)
+            elif isinstance(job, SlideVideoJob):
+                self._process_slide_video_job(idx, job)
+            elif isinstance(job, PomodoroVideoJob):
+                self._process_pomodoro_job(idx, job)
+            else:
+                self._process_logo_job(idx, job)
 
-        for idx, job in enumerate(self.jobs):
-            if self._stop_requested:
+            if job.status in (JobStatus.DONE, JobStatus.DONE_NO_AUDIO):
+                self._count_job("ok")
+            elif job.status == JobStatus.CANCELLED:
+                self._count_job("cancelled")
+            else:
+                self._count_job("error")
+        except FFmpegError as exc:
+            if self._stop_requested and "Cancelled" in str(exc):
                 job.status = JobStatus.CANCELLED
-                self.signals.job_updated.emit(idx, job)
-                cancelled_count += 1
-                continue
-
-            try:
-                if isinstance(job, FrameReplaceJob):
-                    self._process_frame_replace_job(idx, job)
-                elif isinstance(job, SlideVideoJob):
-                    self._process_slide_video_job(idx, job)
-                elif isinstance(job, PomodoroVideoJob):
-                    self._process_pomodoro_job(idx, job)
-                else:
-                    self._process_logo_job(idx, job)
-
-                if job.status in (JobStatus.DONE, JobStatus.DONE_NO_AUDIO):
-                    done_count += 1
-                elif job.status == JobStatus.CANCELLED:
-                    cancelled_count += 1
-                else:
-                    error_count += 1
-            except FFmpegError as exc:
-                if self._stop_requested and "Cancelled" in str(exc):
-                    job.status = JobStatus.CANCELLED
-                    self._log(f"[{job.filename}] Cancelled")
-                    self.signals.job_updated.emit(idx, job)
-                    cancelled_count += 1
-                    continue
-                job.status = JobStatus.ERROR
-                job.error_message = str(exc)
-                job.progress = 0
-                self._log(f"[{job.filename}] Fatal error: {exc}")
-                self.signals.job_updated.emit(idx, job)
-                error_count += 1
-            except Exception as exc:  # pragma: no cover
-                job.status = JobStatus.ERROR
-                job.error_message = str(exc)
-                job.progress = 0
-                self._log(f"[{job.filename}] Unexpected error: {exc}")
-                self.signals.job_updated.emit(idx, job)
-                error_count += 1
-
-            self.signals.queue_progress.emit(idx + 1, len(self.jobs))
-
-        self.signals.finished.emit({"ok": done_count, "error": error_count, "cancelled": cancelled_count})
+                self._log(f"[{job.filename}] Cancelled")
+                self._emit_job(idx, job)
+                self._count_job("cancelled")
+                return
+            job.status = JobStatus.ERROR
+            job.error_message = str(exc)
+            job.progress = 0
+            self._log(f"[{job.filename}] Fatal error: {exc}")
+            self._emit_job(idx, job)
+            self._count_job("error")
+        except Exception as exc:  # pragma: no cover
+            job.status = JobStatus.ERROR
+            job.error_message = str(exc)
+            job.progress = 0
+            self._log(f"[{job.filename}] Unexpected error: {exc}")
+            self._emit_job(idx, job)
+            self._count_job("error")
+
+    def _count_job(self, outcome: str) -> None:
+        with self._counts_lock:
+            self._counts[outcome] += 1
+            self._finished_jobs += 1
+            finished = self._finished_jobs
+            summary = dict(self._counts) if finished == self._total_jobs else None
+        self.signals.queue_progress.emit(finished, self._total_jobs)
+        if summary is not None:
+            self.signals.finished.emit(summary)
 
     def _has_logo_jobs(self) -> bool:
         return any(not isinstance(job, (FrameReplaceJob, SlideVideoJob, PomodoroVideoJob)) for job in self.jobs)
@@ -169,8 +294,7 @@ class ProcessingWorker(QObject):
         )
         timeline = build_timeline(project)
         output_root = Path(job.output_root) if job.output_root else Path(job.input_path).parent
-        project_dir = make_unique_dir(output_root / project.display_name)
-        ensure_output_dir(project_dir)
+        project_dir = self._reserve_dir(output_root / project.display_name)
         temp_dir = project_dir / "temp"
         clips_dir = temp_dir / "clips"
         ensure_output_dir(clips_dir)
@@ -257,14 +381,20 @@ class ProcessingWorker(QObject):
         for i, scene in enumerate(timeline.scenes):
             clip_path = clips_dir / f"clip_{i+1:03d}.mp4"
             timer_video = timer_videos.get(i)
-            cmd = build_pomodoro_scene_clip_command(self.options.ffmpeg_path, project, scene, str(clip_path), timer_video)
+            cmd = with_thread_cap(
+                self.options,
+                build_pomodoro_scene_clip_command(self.options.ffmpeg_path, project, scene, str(clip_path), timer_video),
+            )
             self._run_ffmpeg(cmd, scene.duration, index, job, 0.3, 0.26 / max(1, len(timeline.scenes)))
             clip_paths.append(clip_path)
 
         self._log(f"[{job.output_name}] Step 4/9: concat video")
         video_no_audio = temp_dir / "video_no_audio.mp4"
         self._run_ffmpeg(
-            build_concat_command(self.options.ffmpeg_path, [str(p) for p in clip_paths], str(video_no_audio), True),
+            with_thread_cap(
+                self.options,
+                build_concat_command(self.options.ffmpeg_path, [str(p) for p in clip_paths], str(video_no_audio), True),
+            ),
             timeline.total_duration,
             index,
             job,
@@ -306,7 +436,7 @@ class ProcessingWorker(QObject):
             self._log(f"[{job.output_name}] Step 6/9: write video without audio")
             shutil.copy2(video_no_audio, final_output)
             job.progress = 94
-            self.signals.job_updated.emit(index, job)
+            self._emit_job(index, job)
 
         self._log(f"[{job.output_name}] Step 7/9: generate cover")
         cover_path = project_dir / "cover.png"
@@ -345,52 +475,91 @@ class ProcessingWorker(QObject):
 
     def request_stop(self) -> None:
         self._stop_requested = True
-        if self._current_process and self._current_process.poll() is None:
-            self._current_process.terminate()
+        with self._process_lock:
+            processes = list(self._current_process)
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+
+    def _reserve_dir(self, path: Path) -> Path:
+        # Parallel jobs may target the same output folder: pick and create the
+        # unique directory atomically so two jobs never share it.
+        with self._dir_lock:
+            job_dir = make_unique_dir(path)
+            ensure_output_dir(job_dir)
+        return job_dir
+
+    def _probe_input(self, input_path: str) -> tuple[float, bool, tuple[int, int]]:
+        """Run the duration/audio probe and the video size probe side by side."""
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ffprobe") as pool:
+            media_future = pool.submit(probe_file, self.options.ffprobe_path, input_path)
+            size_future = pool.submit(probe_video_size, self.options.ffprobe_path, input_path)
+            duration, has_audio = media_future.result()
+            return duration, has_audio, size_future.result()
 
     def _prepare_job(self, index: int, job: Job) -> None:
         job.status = JobStatus.PROCESSING
         job.progress = 0
         job.outputs = []
-        self.signals.job_updated.emit(index, job)
+        self._emit_job(index, job)
         self._log(f"[{job.filename}] Processing started")
 
     def _process_logo_job(self, index: int, job: Job) -> None:
         self._prepare_job(index, job)
 
-        duration = probe_duration(self.options.ffprobe_path, job.input_path)
+        # Overlay commands map "0:a?", so the processed video has audio iff the input does.
+        duration, has_audio, video_size = self._probe_input(job.input_path)
         input_path = Path(job.input_path)
-        output_root = resolve_output_root(job.input_path, self.options)
+        stem, suffix = input_path.stem, input_path.suffix
+        output_root = resolve_output_root(input_path, self.options)
         ensure_output_dir(output_root)
 
-        job_dir = make_unique_dir(output_root / input_path.stem)
-        ensure_output_dir(job_dir)
+        job_dir = self._reserve_dir(output_root / stem)
 
-        processed_video = job_dir / f"{input_path.stem}_logo{input_path.suffix}"
+        processed_video = job_dir / f"{stem}_logo{suffix}"
         audio_output = job_dir / f"audio.{self.options.audio_format}"
         frames_dir = job_dir / "frames"
-        original_output = job_dir / f"original{input_path.suffix}"
+        original_output = job_dir / f"original{suffix}"
 
         self._log(f"[{job.filename}] Step 1/4: generating logo video")
-        self._run_overlay_step(index, job, duration, input_path, processed_video)
+        self._run_overlay_step(index, job, duration, input_path, processed_video, video_size)
         job.outputs.append(str(processed_video))
 
+        steps: list[ExtractionStep] = []
         no_audio = False
         if self.options.extract_audio:
             self._log(f"[{job.filename}] Step 2/4: extracting audio")
-            has_audio = has_audio_stream(self.options.ffprobe_path, str(processed_video))
             if not has_audio:
                 no_audio = True
                 self._log(f"[{job.filename}] No audio stream found, skipping audio extraction")
             else:
-                self._extract_audio(index, job, duration, processed_video, audio_output, 0.5, 0.2)
+                steps.append(
+                    (
+                        "audio",
+                        lambda progress: self._extract_audio(
+                            index, job, duration, processed_video, audio_output, 0.5, 0.2, progress
+                        ),
+                    )
+                )
 
         if self.options.extract_frames:
             self._log(f"[{job.filename}] Step 3/4: extracting frames")
             ensure_output_dir(frames_dir)
             pattern = frames_dir / f"frame_%06d.{self.options.frame_format}"
-            cmd = build_frames_command(self.options, str(processed_video), str(pattern))
-            self._run_ffmpeg(cmd, duration, index, job, 0.7, 0.2)
+            steps.append(
+                (
+                    "frames",
+                    lambda progress: self._extract_frames(
+                        index, job, duration, processed_video, pattern, 0.7, 0.2, progress
+                    ),
+                )
+            )
+
+        if len(steps) == 2 and self.options.hwaccel == "none":
+            self._extract_audio_and_frames(index, job, duration, processed_video, audio_output, pattern, 0.5, 0.4)
+        else:
+            self._run_extraction_steps(steps, 0.5, 0.4)
+        if self.options.extract_frames:
             job.outputs.append(str(frames_dir))
 
         self._log(f"[{job.filename}] Step 4/4: finalizing output structure")
@@ -401,6 +570,7 @@ class ProcessingWorker(QObject):
     def _process_frame_replace_job(self, index: int, job: FrameReplaceJob) -> None:
         self._prepare_job(index, job)
         input_path = Path(job.input_path)
+        stem, suffix = input_path.stem, input_path.suffix
 
         try:
             start_seconds = parse_timecode_to_seconds(job.start_time)
@@ -411,8 +581,7 @@ class ProcessingWorker(QObject):
         if start_seconds >= end_seconds:
             raise FFmpegError("start_time must be less than end_time")
 
-        duration = probe_duration(self.options.ffprobe_path, job.input_path)
-        video_width, video_height = probe_video_size(self.options.ffprobe_path, job.input_path)
+        duration, has_audio, (video_width, video_height) = self._probe_input(job.input_path)
         job.start_s = start_seconds
 
         if job.mode == "roi":
@@ -428,22 +597,21 @@ class ProcessingWorker(QObject):
                 job.status = JobStatus.SKIPPED
                 job.error_message = error
                 job.progress = 0
-                self.signals.job_updated.emit(index, job)
+                self._emit_job(index, job)
                 return
 
         self._log(f"[{job.filename}] Frame replace start={job.start_time} end={job.end_time}")
         self._log(f"[{job.filename}] Seconds start={start_seconds:.3f} end={end_seconds:.3f}")
         self._log(f"[{job.filename}] Video size {video_width}x{video_height}")
 
-        output_root = resolve_output_root(job.input_path, self.options)
+        output_root = resolve_output_root(input_path, self.options)
         ensure_output_dir(output_root)
-        job_dir = make_unique_dir(output_root / input_path.stem)
-        ensure_output_dir(job_dir)
+        job_dir = self._reserve_dir(output_root / stem)
 
-        processed_video = job_dir / f"{input_path.stem}_frame_replace.mp4"
+        processed_video = job_dir / f"{stem}_frame_replace.mp4"
         audio_output = job_dir / f"audio.{self.options.audio_format}"
         frames_dir = job_dir / "frames"
-        original_output = job_dir / f"original{input_path.suffix}"
+        original_output = job_dir / f"original{suffix}"
 
         attempts = [
             {"keep_audio": job.keep_audio, "expression_style": "escaped", "tag": "primary"},
@@ -484,25 +652,57 @@ class ProcessingWorker(QObject):
 
         job.outputs.append(str(processed_video))
 
+        steps: list[ExtractionStep] = []
         no_audio = False
         if job.also_extract_audio:
-            has_audio = has_audio_stream(self.options.ffprobe_path, str(processed_video))
             if not has_audio:
                 no_audio = True
                 self._log(f"[{job.filename}] No audio stream found, skipping audio extraction")
             else:
-                self._extract_audio(index, job, duration, processed_video, audio_output, 0.7, 0.15)
+                steps.append(
+                    (
+                        "audio",
+                        lambda progress: self._extract_audio(
+                            index, job, duration, processed_video, audio_output, 0.7, 0.15, progress
+                        ),
+                    )
+                )
 
         if job.also_extract_frames:
             ensure_output_dir(frames_dir)
             pattern = frames_dir / f"frame_%06d.{self.options.frame_format}"
-            cmd_frames = build_frames_command(
-                self.options,
-                str(processed_video),
-                str(pattern),
+            steps.append(
+                (
+                    "frames",
+                    lambda progress: self._extract_frames(
+                        index,
+                        job,
+                        duration,
+                        processed_video,
+                        pattern,
+                        0.85,
+                        0.1,
+                        progress,
+                        frame_interval_sec=job.frame_interval_sec,
+                    ),
+                )
+            )
+
+        if len(steps) == 2 and self.options.hwaccel == "none":
+            self._extract_audio_and_frames(
+                index,
+                job,
+                duration,
+                processed_video,
+                audio_output,
+                pattern,
+                0.7,
+                0.25,
                 frame_interval_sec=job.frame_interval_sec,
             )
-            self._run_ffmpeg(cmd_frames, duration, index, job, 0.85, 0.1)
+        else:
+            self._run_extraction_steps(steps, 0.7, 0.25)
+        if job.also_extract_frames:
             job.outputs.append(str(frames_dir))
 
         shutil.move(str(input_path), str(original_output))
@@ -544,8 +744,7 @@ class ProcessingWorker(QObject):
         width, height = project.settings.resolution
 
         output_root = Path(job.output_root) if job.output_root else Path(job.input_path).parent
-        project_dir = make_unique_dir(output_root / project.display_name)
-        ensure_output_dir(project_dir)
+        project_dir = self._reserve_dir(output_root / project.display_name)
         temp_dir = project_dir / "temp"
         scenes_dir = project_dir / "scenes"
         audio_tmp_dir = temp_dir / "audio"
@@ -572,16 +771,19 @@ class ProcessingWorker(QObject):
         for idx_scene, scene in enumerate(project.scenes):
             duration = scene_duration(project, scene) / max(0.25, min(4.0, project.settings.playback_speed))
             clip_output = temp_dir / f"scene_{idx_scene+1:03d}.mp4"
-            scene_cmd = build_scene_clip_command(
-                self.options.ffmpeg_path,
-                scene,
-                str(clip_output),
-                width,
-                height,
-                project.settings.fps,
-                duration,
-                project.settings.scale_mode,
-                overwrite=True,
+            scene_cmd = with_thread_cap(
+                self.options,
+                build_scene_clip_command(
+                    self.options.ffmpeg_path,
+                    scene,
+                    str(clip_output),
+                    width,
+                    height,
+                    project.settings.fps,
+                    duration,
+                    project.settings.scale_mode,
+                    overwrite=True,
+                ),
             )
             self._run_ffmpeg(scene_cmd, duration, index, job, 0.05, 0.45 / total_scenes)
             video_clips.append(clip_output)
@@ -629,7 +831,7 @@ class ProcessingWorker(QObject):
         job.output_path = str(job_dir)
         job.progress = 100
         job.status = JobStatus.DONE_NO_AUDIO if no_audio else JobStatus.DONE
-        self.signals.job_updated.emit(index, job)
+        self._emit_job(index, job)
         self._log(f"[{job.filename}] Processing finished")
 
     def _extract_audio(
@@ -641,10 +843,11 @@ class ProcessingWorker(QObject):
         audio_output: Path,
         offset: float,
         weight: float,
+        progress: Optional[Callable[[float], float]] = None,
     ) -> None:
         try:
             cmd = build_audio_command(self.options, str(processed_video), str(audio_output))
-            self._run_ffmpeg(cmd, duration, index, job, offset, weight)
+            self._run_ffmpeg(cmd, duration, index, job, offset, weight, progress)
         except FFmpegError as exc:
             if self.options.audio_mode == "copy" and self.options.audio_format == "m4a":
                 self._log(f"[{job.filename}] Copy mode failed, fallback to transcode: {exc}")
@@ -654,11 +857,89 @@ class ProcessingWorker(QObject):
                     str(audio_output),
                     force_transcode=True,
                 )
-                self._run_ffmpeg(fallback_cmd, duration, index, job, offset, weight)
+                self._run_ffmpeg(fallback_cmd, duration, index, job, offset, weight, progress)
             else:
                 raise
         job.outputs.append(str(audio_output))
 
+    def _extract_frames(
+        self,
+        index: int,
+        job: Job,
+        duration: float,
+        processed_video: Path,
+        pattern: Path,
+        offset: float,
+        weight: float,
+        progress: Optional[Callable[[float], float]] = None,
+        frame_interval_sec: int | None = None,
+    ) -> None:
+        cmd = build_frames_command(self.options, str(processed_video), str(pattern), frame_interval_sec)
+        try:
+            self._run_ffmpeg(cmd, duration, index, job, offset, weight, progress)
+        except FFmpegError as exc:
+            if self.options.hwaccel == "none" or self._stop_requested:
+                raise
+            self._log(f"[{job.filename}] Hardware decode ({self.options.hwaccel}) failed, fallback to CPU: {exc}")
+            fallback_cmd = build_frames_command(
+                replace(self.options, hwaccel="none"),
+                str(processed_video),
+                str(pattern),
+                frame_interval_sec,
+            )
+            self._run_ffmpeg(fallback_cmd, duration, index, job, offset, weight, progress)
+
+    def _extract_audio_and_frames(
+        self,
+        index: int,
+        job: Job,
+        duration: float,
+        processed_video: Path,
+        audio_output: Path,
+        pattern: Path,
+        offset: float,
+        weight: float,
+        frame_interval_sec: int | None = None,
+    ) -> None:
+        def build(force_transcode: bool) -> list[str]:
+            return build_combined_command(
+                self.options,
+                str(processed_video),
+                str(audio_output),
+                str(pattern),
+                frame_interval_sec,
+                force_transcode=force_transcode,
+            )
+
+        try:
+            self._run_ffmpeg(build(False), duration, index, job, offset, weight)
+        except FFmpegError as exc:
+            if self.options.audio_mode == "copy" and self.options.audio_format == "m4a" and not self._stop_requested:
+                self._log(f"[{job.filename}] Copy mode failed, fallback to transcode: {exc}")
+                self._run_ffmpeg(build(True), duration, index, job, offset, weight)
+            else:
+                raise
+        job.outputs.append(str(audio_output))
+
+    def _run_extraction_steps(self, steps: list[ExtractionStep], offset: float, weight: float) -> None:
+        """Run independent extraction steps (audio, frames) as concurrent ffmpeg processes.
+
+        Each step reads the same source, so decoding overlaps instead of running
+        back to back. Job progress is the mean of the steps' own ratios.
+        """
+        if len(steps) < 2:
+            for _, run_step in steps:
+                run_step(None)
+            return
+
+        tracker = _ParallelProgress(offset, weight, [name for name, _ in steps])
+        with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="ffmpeg-step") as pool:
+            futures = [pool.submit(run_step, tracker.step(name)) for name, run_step in steps]
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+
     def _run_overlay_step(
         self,
         index: int,
@@ -666,8 +947,9 @@ class ProcessingWorker(QObject):
         duration: float,
         input_path: Path,
         processed_video: Path,
+        video_size: tuple[int, int],
     ) -> None:
-        video_width, video_height = probe_video_size(self.options.ffprobe_path, str(input_path))
+        video_width, video_height = video_size
         preferred_rect = (
             self.options.logo_left,
             self.options.logo_top,
@@ -699,7 +981,8 @@ class ProcessingWorker(QObject):
         except FFmpegError as exc:
             if "code" in str(exc):
                 self._log(f"[{job.filename}] Audio copy failed on video export, retry with AAC")
-                cmd_with_aac = cmd[:-2] + ["-c:a", "aac", "-b:a", "192k", str(processed_video)]
+                codec_at = cmd.index("-c:a") + 1
+                cmd_with_aac = cmd[:codec_at] + ["aac", "-b:a", "192k"] + cmd[codec_at + 1 :]
                 self._run_ffmpeg(cmd_with_aac, duration, index, job, 0.0, 0.5)
             else:
                 raise
@@ -712,51 +995,67 @@ class ProcessingWorker(QObject):
         job: Job,
         progress_offset: float,
         step_weight: float,
+        progress: Optional[Callable[[float], float]] = None,
     ) -> None:
+        to_job_ratio = progress or (lambda stage_ratio: progress_offset + stage_ratio * step_weight)
+        inv_duration = 1.0 / duration if duration > 0 else 0.0
         executable_name = Path(command[0]).name.lower()
         is_ffmpeg_executable = executable_name.startswith("ffmpeg")
-        ffmpeg_cmd = [command[0], "-progress", "pipe:1", "-nostats", *command[1:]] if is_ffmpeg_executable else command
-        self._log(f"Running: {' '.join(ffmpeg_cmd)}")
 
-        ffmpeg_lines: list[str] = []
+        # ffmpeg writes -progress to a temp file instead of a pipe; the output
+        # loop below tails it on every line and every idle tick.
+        progress_path = ""
+        if is_ffmpeg_executable:
+            with tempfile.NamedTemporaryFile(prefix="ffmpeg_progress_", suffix=".txt", delete=False) as progress_file:
+                progress_path = progress_file.name
+            ffmpeg_cmd = [command[0], "-progress", progress_path, "-nostats", *command[1:]]
+        else:
+            ffmpeg_cmd = command
+        self._log(f"Running: {' '.join(ffmpeg_cmd)}")
 
-        self._current_process = subprocess.Popen(
-            ffmpeg_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            bufsize=1,
-        )
+        try:
+            process = subprocess.Popen(
+                ffmpeg_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=False,
+                bufsize=0,
+                **spawn_kwargs(ffmpeg_cmd),
+            )
+            with self._process_lock:
+                self._current_process.append(process)
 
-        recent_output: list[str] = []
-        assert self._current_process.stdout is not None
-        for raw_line in self._current_process.stdout:
-            if self._stop_requested:
-                self._current_process.terminate()
-                break
-            line = raw_line.strip()
-            if not line:
-                continue
-            recent_output.append(line)
-            if len(recent_output) > 30:
-                recent_output.pop(0)
-
-            if line.startswith("out_time_ms="):
-                out_time_ms = self._parse_out_time_ms(line.split("=", 1)[1])
-                if out_time_ms is not None:
-                    self._update_progress(index, job, progress_offset, step_weight, duration, out_time_ms / 1_000_000)
-            elif line.startswith("out_time="):
-                out_time = self._parse_time(line.split("=", 1)[1])
-                if out_time is not None:
-                    self._update_progress(index, job, progress_offset, step_weight, duration, out_time)
-            elif line.startswith("progress=") and line.endswith("end"):
-                job.progress = min(100, int((progress_offset + step_weight) * 100))
-                self.signals.job_updated.emit(index, job)
-
-        return_code = self._current_process.wait()
-        self._current_process = None
+            progress_tail = _ProgressFileTail(progress_path) if progress_path else None
+            recent_output: list[str] = []
+            try:
+                for line in self._iter_output_lines(process):
+                    if self._stop_requested:
+                        process.terminate()
+                        break
+                    if progress_tail is not None:
+                        for progress_line in progress_tail.poll():
+                            self._handle_progress_line(progress_line, index, job, to_job_ratio, inv_duration)
+                    if not line:
+                        continue
+                    recent_output.append(line)
+                    if len(recent_output) > 30:
+                        recent_output.pop(0)
+
+                return_code = process.wait()
+                if progress_tail is not None:
+                    for progress_line in progress_tail.poll():
+                        self._handle_progress_line(progress_line, index, job, to_job_ratio, inv_duration)
+            finally:
+                if progress_tail is not None:
+                    progress_tail.close()
+                with self._process_lock:
+                    self._current_process.remove(process)
+        finally:
+            if progress_path:
+                try:
+                    os.remove(progress_path)
+                except OSError:
+                    pass
 
         if self._stop_requested:
             raise FFmpegError("Cancelled")
@@ -764,47 +1063,116 @@ class ProcessingWorker(QObject):
             tail = "\n".join(recent_output[-10:])
             raise FFmpegError(f"ffmpeg failed with code {return_code}. Last output:\n{tail}")
 
+    def _handle_progress_line(
+        self,
+        line: bytes,
+        index: int,
+        job: Job,
+        to_job_ratio: Callable[[float], float],
+        inv_duration: float,
+    ) -> None:
+        match = _PROGRESS_RE.match(line)
+        if match is None:
+            return
+        key, value = match.groups()
+        if key == b"out_time_ms":
+            out_time_ms = self._parse_out_time_ms(value)
+            if out_time_ms is not None:
+                self._update_progress(index, job, to_job_ratio, inv_duration, out_time_ms / 1_000_000)
+        elif value == b"end":
+            job.progress = min(100, int(to_job_ratio(1.0) * 100))
+            self._emit_job(index, job)
+
+    def _iter_output_lines(self, process: subprocess.Popen[bytes]) -> Iterator[str]:
+        """Yield stripped output lines; yields "" every ~50 ms of silence.
+
+        The idle ticks let the caller react to a stop request without waiting for
+        ffmpeg to flush the next line. Bytes are drained in large chunks and only
+        complete lines are decoded.
+        """
+        buffer = bytearray()
+        for chunk in self._iter_output_chunks(process):
+            if not chunk:
+                yield ""
+                continue
+            buffer += chunk
+            *lines, rest = buffer.split(b"\n")
+            buffer = bytearray(rest)
+            for raw_line in lines:
+                yield raw_line.decode("utf-8", errors="replace").strip()
+        if buffer:
+            yield buffer.decode("utf-8", errors="replace").strip()
+
+    @staticmethod
+    def _iter_output_chunks(process: subprocess.Popen[bytes]) -> Iterator[bytes]:
+        assert process.stdout is not None
+        fd = process.stdout.fileno()
+
+        if os.name != "nt":
+            with selectors.DefaultSelector() as selector:
+                selector.register(process.stdout, selectors.EVENT_READ)
+                while True:
+                    if not selector.select(timeout=OUTPUT_POLL_INTERVAL_SEC):
+                        yield b""
+                        continue
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        return
+                    yield chunk
+
+        # Windows selectors only support sockets: drain the pipe on a helper thread.
+        chunks: queue.Queue[bytes] = queue.Queue()
+
+        def pump() -> None:
+            while True:
+                chunk = os.read(fd, 65536)
+                chunks.put(chunk)
+                if not chunk:
+                    return
+
+        threading.Thread(target=pump, daemon=True).start()
+        while True:
+            try:
+                chunk = chunks.get(timeout=OUTPUT_POLL_INTERVAL_SEC)
+            except queue.Empty:
+                yield b""
+                continue
+            if not chunk:
+                return
+            yield chunk
+
     def _update_progress(
         self,
         index: int,
         job: Job,
-        progress_offset: float,
-        step_weight: float,
-        duration: float,
+        to_job_ratio: Callable[[float], float],
+        inv_duration: float,
         current_seconds: float,
     ) -> None:
-        if duration <= 0:
+        if inv_duration <= 0:
             return
-        stage_ratio = max(0.0, min(1.0, current_seconds / duration))
-        total_ratio = progress_offset + stage_ratio * step_weight
-        job.progress = min(99, int(total_ratio * 100))
-        self.signals.job_updated.emit(index, job)
+        stage_ratio = max(0.0, min(1.0, current_seconds * inv_duration))
+        total_ratio = to_job_ratio(stage_ratio)
+        new_progress = min(99, int(total_ratio * 100))
+        job.progress = new_progress
+
+        now = time.monotonic()
+        last_emit_ts, last_emitted_progress = self._last_progress_emit.get(index, (0.0, -1))
+        if new_progress == last_emitted_progress or now - last_emit_ts < PROGRESS_EMIT_INTERVAL_SEC:
+            return
+        self._last_progress_emit[index] = (now, new_progress)
+        self._emit_job(index, job)
 
     @staticmethod
-    def _parse_out_time_ms(raw_value: str) -> Optional[int]:
-        value = raw_value.strip()
-        if not value or value == "N/A":
-            return None
+    def _parse_out_time_ms(raw_value: bytes) -> Optional[int]:
+        # int() accepts ASCII digits in bytes; "N/A" ends up in ValueError.
         try:
-            return int(value)
+            return int(raw_value)
         except ValueError:
             return None
 
-    @staticmethod
-    def _parse_time(raw_time: str) -> Optional[float]:
-        value = raw_time.strip()
-        if not value or value == "N/A":
-            return None
-        parts = value.split(":")
-        if len(parts) != 3:
-            return None
-        try:
-            h = float(parts[0])
-            m = float(parts[1])
-            s = float(parts[2])
-        except ValueError:
-            return None
-        return h * 3600 + m * 60 + s
+    def _emit_job(self, index: int, job: Job) -> None:
+        self.signals.job_updated.emit(index, job.status.value, job.progress, job.output_path)
 
     def _log(self, message: str) -> None:
         timestamp = datetime.now().strftime("%H:%M:%S")
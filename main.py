@@ -11,6 +11,8 @@ from core.worker import ProcessingWorker
 
 
 def run_test_mode() -> int:
+    from PyQt6.QtCore import Qt
+
     input_file = Path("samples/input.mp4")
     output_dir = Path("samples/out")
     logo_file = Path("samples/logo.png")
@@ -42,8 +44,11 @@ def run_test_mode() -> int:
 
     jobs = [Job(input_path=str(input_file))]
     worker = ProcessingWorker(jobs, options)
-    worker.signals.log.connect(print)
-    worker.signals.finished.connect(lambda summary: print(f"Summary: {summary}"))
+    # No event loop runs in test mode: deliver on the emitting thread, including
+    # the helper threads a job uses for probing and parallel extraction steps.
+    direct = Qt.ConnectionType.DirectConnection
+    worker.signals.log.connect(print, direct)
+    worker.signals.finished.connect(lambda summary: print(f"Summary: {summary}"), direct)
 
     print("Starting test mode...")
     worker.run()
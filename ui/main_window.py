@@ -4,7 +4,7 @@ import os
 import re
 from pathlib import Path
 
-from PyQt6.QtCore import QDir, QSettings, QThread
+from PyQt6.QtCore import QDir, QSettings, QThreadPool, QTimer
 from PyQt6.QtGui import QDesktopServices, QFileSystemModel
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -14,6 +14,7 @@ from PyQt6.QtWidgets import (
     QFormLayout,
     QGridLayout,
     QGroupBox,
+    QHeaderView,
     QHBoxLayout,
     QLabel,
     QLineEdit,
@@ -24,31 +25,35 @@ from PyQt6.QtWidgets import (
     QPlainTextEdit,
     QSpinBox,
     QSplitter,
+    QTableView,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
     QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
 from core.ffmpeg import (
+    HWACCEL_MODES,
+    LOGO_EXTENSIONS,
     LOGO_HEIGHT,
     LOGO_LEFT,
     LOGO_TOP,
     LOGO_WIDTH,
     VIDEO_EXTENSIONS,
+    clear_binary_cache,
     detect_ffmpeg,
     ffprobe_from_ffmpeg,
     is_logo_file,
-    is_video_file,
 )
-from core.jobs import FrameReplaceJob, Job, PomodoroVideoJob, ProcessingOptions, SlideVideoJob
+from core.jobs import FrameReplaceJob, Job, JobStatus, PomodoroVideoJob, ProcessingOptions, SlideVideoJob
 from core.worker import ProcessingWorker
+from ui.models.job_table_model import JobTableModel
 from ui.tabs.frame_replace_tab import FrameReplaceTab
 from ui.tabs.pomodoro_tab import PomodoroTab
 from ui.tabs.slide_video_tab import SlideVideoTab
 
+_VIDEO_EXT_SET = frozenset(ext.lower() for ext in VIDEO_EXTENSIONS)
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -57,13 +62,37 @@ class MainWindow(QMainWindow):
         self.resize(1320, 800)
 
         self.jobs: list[Job] = []
-        self._thread: QThread | None = None
+        # (job type, normalized input path) of queued file jobs, for O(1) duplicate checks.
+        self._job_paths: set[tuple[type, str]] = set()
         self._worker: ProcessingWorker | None = None
+        # (ffmpeg path, derived ffprobe path); refreshed when the ffmpeg path edit changes.
+        self._ffprobe_cache: tuple[str, str] = ("", "")
 
         self.settings = QSettings("VideoSplitter", "VideoSplitter")
 
+        # Worker progress and log lines arrive far faster than the eye needs;
+        # repaint rows and append log text at ~30 Hz.
+        # row -> (status, progress, output path) from the latest job_updated signal.
+        self._pending_row_updates: dict[int, tuple[str, int, str]] = {}
+        # Last state queued per row; repeated identical ticks are dropped.
+        self._last_shown: dict[int, tuple[str, int, str]] = {}
+        # row -> progress of jobs currently processing; with a job pool several run at once.
+        self._running_rows: dict[int, int] = {}
+        self._log_buffer: list[str] = []
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setInterval(33)
+        self._ui_flush_timer.setSingleShot(False)
+        self._ui_flush_timer.timeout.connect(self._flush_ui_updates)
+
+        # Settings are flushed once the user stops editing, never per keystroke.
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setInterval(2000)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.timeout.connect(self._save_settings)
+
         self._build_ui()
         self._load_settings()
+        self._connect_settings_autosave()
 
     def _build_ui(self) -> None:
         root = QWidget(self)
@@ -86,14 +115,18 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(container)
 
         self.fs_model = QFileSystemModel(self)
-        self.fs_model.setRootPath(QDir.rootPath())
+        # Watch only the folder the tree shows, and list only files the queue/logo picker accept.
+        self.fs_model.setRootPath(QDir.homePath())
         self.fs_model.setFilter(QDir.Filter.AllDirs | QDir.Filter.Files | QDir.Filter.NoDotAndDotDot)
+        self.fs_model.setNameFilters(sorted(f"*{ext}" for ext in VIDEO_EXTENSIONS | LOGO_EXTENSIONS))
+        self.fs_model.setNameFilterDisables(False)
 
         self.tree = QTreeView()
         self.tree.setModel(self.fs_model)
         self.tree.setRootIndex(self.fs_model.index(QDir.homePath()))
         self.tree.doubleClicked.connect(self._on_tree_double_click)
         self.tree.setAlternatingRowColors(True)
+        self.tree.setUniformRowHeights(True)
         for col in (1, 2, 3):
             self.tree.hideColumn(col)
         layout.addWidget(QLabel("File manager"))
@@ -117,11 +150,22 @@ class MainWindow(QMainWindow):
         buttons_layout.addWidget(self.clear_btn)
         layout.addLayout(buttons_layout)
 
-        self.queue_table = QTableWidget(0, 4)
-        self.queue_table.setHorizontalHeaderLabels(["Filename", "Status", "Progress", "Output"])
+        self.queue_model = JobTableModel(self.jobs, self)
+        self.queue_table = QTableView()
+        self.queue_table.setModel(self.queue_model)
         self.queue_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.queue_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.queue_table.horizontalHeader().setStretchLastSection(True)
+        # Explicit widths: the header never measures (possibly long) cell text to size columns.
+        horizontal_header = self.queue_table.horizontalHeader()
+        horizontal_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        horizontal_header.setStretchLastSection(True)
+        self.queue_table.setColumnWidth(0, 260)
+        self.queue_table.setColumnWidth(1, 90)
+        self.queue_table.setColumnWidth(2, 70)
+        # Uniform row height: inserting rows never measures cell contents.
+        vertical_header = self.queue_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(22)
         self.queue_table.setAlternatingRowColors(True)
         layout.addWidget(QLabel("Queue"))
         layout.addWidget(self.queue_table)
@@ -146,6 +190,7 @@ class MainWindow(QMainWindow):
         ffmpeg_form.addWidget(QLabel("ffmpeg path"), 0, 0)
         ffmpeg_form.addWidget(self.ffmpeg_path_edit, 0, 1)
         ffmpeg_form.addWidget(self.ffmpeg_browse_btn, 0, 2)
+        self.ffmpeg_path_edit.editingFinished.connect(self._refresh_ffprobe_path)
         layout.addWidget(ffmpeg_group)
 
         output_group = QGroupBox("Output")
@@ -160,6 +205,10 @@ class MainWindow(QMainWindow):
         self.save_next_checkbox = QCheckBox("Save next to input file")
         output_layout.addRow("Output folder", output_row)
         output_layout.addRow(self.save_next_checkbox)
+        self.parallel_jobs_spin = QSpinBox()
+        self.parallel_jobs_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self.parallel_jobs_spin.setValue(self._default_parallel_jobs())
+        output_layout.addRow("Parallel jobs", self.parallel_jobs_spin)
         layout.addWidget(output_group)
 
         self.tabs = QTabWidget()
@@ -189,6 +238,7 @@ class MainWindow(QMainWindow):
 
         self.log_edit = QPlainTextEdit()
         self.log_edit.setReadOnly(True)
+        self.log_edit.document().setMaximumBlockCount(5000)
         layout.addWidget(QLabel("Log"))
         layout.addWidget(self.log_edit)
 
@@ -243,10 +293,13 @@ class MainWindow(QMainWindow):
         self.image_format_combo.addItems(["jpg", "png"])
         self.resize_combo = QComboBox()
         self.resize_combo.addItems(["original", "1280w", "1920w"])
+        self.hwaccel_combo = QComboBox()
+        self.hwaccel_combo.addItems(list(HWACCEL_MODES))
         frame_layout.addRow(self.extract_frames_checkbox)
         frame_layout.addRow("Interval seconds", self.interval_spin)
         frame_layout.addRow("Image format", self.image_format_combo)
         frame_layout.addRow("Resize", self.resize_combo)
+        frame_layout.addRow("Hardware decode", self.hwaccel_combo)
 
         exec_group = QGroupBox("Execution")
         exec_layout = QVBoxLayout(exec_group)
@@ -283,36 +336,91 @@ class MainWindow(QMainWindow):
     def _load_settings(self) -> None:
         ffmpeg_path = self.settings.value("ffmpeg_path", detect_ffmpeg() or "ffmpeg")
         self.ffmpeg_path_edit.setText(str(ffmpeg_path))
+        self._refresh_ffprobe_path()
         self.output_folder_edit.setText(str(self.settings.value("output_folder", "")))
         self.save_next_checkbox.setChecked(self.settings.value("save_next", False, type=bool))
         self.logo_file_edit.setText(str(self.settings.value("logo_path", "")))
         self.logo_coords_edit.setText(str(self.settings.value("logo_coords", self.logo_coords_edit.text())))
         self.delogo_checkbox.setChecked(self.settings.value("remove_old_logo", True, type=bool))
+        self.parallel_jobs_spin.setValue(self.settings.value("parallel_jobs", self._default_parallel_jobs(), type=int))
+        # Stored values only; keys missing from QSettings are written on first save.
+        self._settings_cache = {
+            key: self.settings.value(key)
+            for key in self._settings_from_widgets()
+            if self.settings.contains(key)
+        }
+        for key in ("save_next", "remove_old_logo"):
+            if key in self._settings_cache:
+                self._settings_cache[key] = self.settings.value(key, type=bool)
+        if "parallel_jobs" in self._settings_cache:
+            self._settings_cache["parallel_jobs"] = self.settings.value("parallel_jobs", type=int)
+
+    def _connect_settings_autosave(self) -> None:
+        for edit in (self.ffmpeg_path_edit, self.output_folder_edit, self.logo_file_edit, self.logo_coords_edit):
+            edit.textChanged.connect(self._schedule_settings_save)
+        self.save_next_checkbox.toggled.connect(self._schedule_settings_save)
+        self.delogo_checkbox.toggled.connect(self._schedule_settings_save)
+        self.parallel_jobs_spin.valueChanged.connect(self._schedule_settings_save)
+
+    def _schedule_settings_save(self, *_args) -> None:
+        self._settings_save_timer.start()
 
     def closeEvent(self, event) -> None:  # noqa: N802
+        if self._worker is not None:
+            answer = QMessageBox.question(
+                self,
+                "Processing",
+                "Processing is still running. Stop it and exit?",
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+            # Pool threads are not daemonic: without this, queued jobs keep running headless after exit.
+            self._worker.request_stop()
+        self._settings_save_timer.stop()
         self._save_settings()
         super().closeEvent(event)
 
+    def _settings_from_widgets(self) -> dict[str, object]:
+        return {
+            "ffmpeg_path": self.ffmpeg_path_edit.text().strip(),
+            "output_folder": self.output_folder_edit.text().strip(),
+            "save_next": self.save_next_checkbox.isChecked(),
+            "logo_path": self.logo_file_edit.text().strip(),
+            "logo_coords": self.logo_coords_edit.text().strip(),
+            "remove_old_logo": self.delogo_checkbox.isChecked(),
+            "parallel_jobs": self.parallel_jobs_spin.value(),
+        }
+
+    @staticmethod
+    def _default_parallel_jobs() -> int:
+        return max(1, (os.cpu_count() or 1) // 2)
+
     def _save_settings(self) -> None:
-        self.settings.setValue("ffmpeg_path", self.ffmpeg_path_edit.text().strip())
-        self.settings.setValue("output_folder", self.output_folder_edit.text().strip())
-        self.settings.setValue("save_next", self.save_next_checkbox.isChecked())
-        self.settings.setValue("logo_path", self.logo_file_edit.text().strip())
-        self.settings.setValue("logo_coords", self.logo_coords_edit.text().strip())
-        self.settings.setValue("remove_old_logo", self.delogo_checkbox.isChecked())
+        # Only write keys that changed: each setValue is a registry round-trip on Windows.
+        changed = False
+        for key, value in self._settings_from_widgets().items():
+            if key in self._settings_cache and self._settings_cache[key] == value:
+                continue
+            self.settings.setValue(key, value)
+            self._settings_cache[key] = value
+            changed = True
+        if changed:
+            self.settings.sync()
 
     def _on_tree_double_click(self, index) -> None:
-        path = Path(self.fs_model.filePath(index))
-        if path.is_file() and is_video_file(path):
-            self._add_job(Job(input_path=str(path)))
+        self._add_tree_video(self.fs_model.filePath(index))
 
     def add_selected_from_tree(self) -> None:
         index = self.tree.currentIndex()
         if not index.isValid():
             return
-        path = Path(self.fs_model.filePath(index))
-        if path.is_file() and is_video_file(path):
-            self._add_job(Job(input_path=str(path)))
+        self._add_tree_video(self.fs_model.filePath(index))
+
+    def _add_tree_video(self, path: str) -> None:
+        # Extension check first: the isfile() stat only runs for video names.
+        if os.path.splitext(path)[1].lower() in _VIDEO_EXT_SET and os.path.isfile(path):
+            self._add_job(Job(input_path=os.path.normpath(path)))
 
     def set_logo_from_tree(self) -> None:
         index = self.tree.currentIndex()
@@ -326,16 +434,23 @@ class MainWindow(QMainWindow):
 
     def add_files(self) -> None:
         files, _ = QFileDialog.getOpenFileNames(self, "Select videos", "", "Video files (*.mp4 *.mov *.mkv *.avi)")
-        for file_path in files:
-            self._add_job(Job(input_path=file_path))
+        self._add_jobs_bulk(files)
 
     def add_folder(self) -> None:
         folder = QFileDialog.getExistingDirectory(self, "Select folder")
         if not folder:
             return
-        for child in sorted(Path(folder).iterdir()):
-            if child.is_file() and child.suffix.lower() in VIDEO_EXTENSIONS:
-                self._add_job(Job(input_path=str(child)))
+        # scandir reuses the directory listing's file type, so is_file() needs no stat per entry.
+        with os.scandir(folder) as it:
+            entries = [
+                entry
+                for entry in it
+                if os.path.splitext(entry.name)[1].lower() in _VIDEO_EXT_SET and entry.is_file()
+            ]
+        # normcase: same order as the Path-based sort, i.e. case-insensitive on Windows.
+        entries.sort(key=lambda entry: os.path.normcase(entry.name))
+        # QFileDialog returns forward slashes; normpath keeps queued inputs in native form.
+        self._add_jobs_bulk([os.path.normpath(entry.path) for entry in entries])
 
     def add_frame_replace_job(self, job: FrameReplaceJob) -> None:
         self._add_job(job)
@@ -346,53 +461,84 @@ class MainWindow(QMainWindow):
     def add_pomodoro_job(self, job: PomodoroVideoJob) -> None:
         self._add_job(job)
 
+    @staticmethod
+    def _job_key(job: Job) -> tuple[type, str] | None:
+        if isinstance(job, (SlideVideoJob, PomodoroVideoJob)):
+            return None
+        return type(job), os.path.normcase(os.path.abspath(job.input_path))
+
+    def _reserve_job_path(self, job: Job) -> bool:
+        """Remember job's input path; False if the same kind of job is already queued for it."""
+        key = self._job_key(job)
+        if key is None:
+            return True
+        if key in self._job_paths:
+            return False
+        self._job_paths.add(key)
+        return True
+
     def _add_job(self, job: Job) -> None:
-        if not isinstance(job, (SlideVideoJob, PomodoroVideoJob)):
-            if any(Path(existing.input_path) == Path(job.input_path) and type(existing) is type(job) for existing in self.jobs):
-                return
-        self.jobs.append(job)
-        row = self.queue_table.rowCount()
-        self.queue_table.insertRow(row)
-        if isinstance(job, FrameReplaceJob):
-            title = f"[FrameReplace] {job.filename}"
-        elif isinstance(job, SlideVideoJob):
-            title = f"[SlideVideo] {job.output_name}"
-        elif isinstance(job, PomodoroVideoJob):
-            title = f"[Pomodoro] {job.output_name}"
-        else:
-            title = job.filename
-        self.queue_table.setItem(row, 0, QTableWidgetItem(title))
-        self.queue_table.setItem(row, 1, QTableWidgetItem(job.status.value))
-        self.queue_table.setItem(row, 2, QTableWidgetItem("0"))
-        self.queue_table.setItem(row, 3, QTableWidgetItem(""))
+        if not self._reserve_job_path(job):
+            return
+        self.queue_model.append_job(job)
+
+    def _add_jobs_bulk(self, paths: list[str]) -> None:
+        new_jobs = [job for job in (Job(input_path=path) for path in paths) if self._reserve_job_path(job)]
+        if not new_jobs:
+            return
+
+        # One insert notification and one repaint for the whole batch.
+        sorting_enabled = self.queue_table.isSortingEnabled()
+        self.queue_table.setSortingEnabled(False)
+        self.queue_table.setUpdatesEnabled(False)
+        try:
+            self.queue_model.append_jobs(new_jobs)
+        finally:
+            self.queue_table.setUpdatesEnabled(True)
+            self.queue_table.setSortingEnabled(sorting_enabled)
         self.total_progress.setMaximum(max(1, len(self.jobs)))
 
+    def _selected_rows(self) -> list[int]:
+        return sorted(index.row() for index in self.queue_table.selectionModel().selectedRows())
+
     def selected_queue_video_path(self) -> str:
-        rows = sorted({idx.row() for idx in self.queue_table.selectedIndexes()})
+        rows = self._selected_rows()
         if not rows:
             return ""
         return self.jobs[rows[0]].input_path
 
     def remove_selected(self) -> None:
-        rows = sorted({idx.row() for idx in self.queue_table.selectedIndexes()}, reverse=True)
+        rows = self._selected_rows()
         for row in rows:
-            self.queue_table.removeRow(row)
-            self.jobs.pop(row)
+            self._job_paths.discard(self._job_key(self.jobs[row]))
+        self.queue_table.setUpdatesEnabled(False)
+        try:
+            self.queue_model.remove_rows(rows)
+        finally:
+            self.queue_table.setUpdatesEnabled(True)
+        # Row numbers shifted; cached per-row state no longer lines up.
+        self._last_shown.clear()
+        self._running_rows.clear()
         self.total_progress.setMaximum(max(1, len(self.jobs)))
 
     def clear_queue(self) -> None:
-        if self._thread and self._thread.isRunning():
+        if self._worker is not None:
             QMessageBox.warning(self, "Busy", "Cannot clear queue while processing")
             return
-        self.jobs.clear()
-        self.queue_table.setRowCount(0)
+        self._pending_row_updates.clear()
+        self._last_shown.clear()
+        self._running_rows.clear()
+        self.queue_model.clear()
+        self._job_paths.clear()
         self.total_progress.reset()
         self.current_progress.reset()
 
     def browse_ffmpeg(self) -> None:
         path, _ = QFileDialog.getOpenFileName(self, "Select ffmpeg executable", "", "Executable (*.exe);;All files (*)")
         if path:
+            clear_binary_cache()
             self.ffmpeg_path_edit.setText(path)
+            self._refresh_ffprobe_path()
 
     def browse_output(self) -> None:
         folder = QFileDialog.getExistingDirectory(self, "Select output folder")
@@ -405,11 +551,14 @@ class MainWindow(QMainWindow):
             self.logo_file_edit.setText(path)
 
     def _collect_options(self) -> ProcessingOptions:
-        ffmpeg_path = self.ffmpeg_path_edit.text().strip() or "ffmpeg"
+        ffmpeg_path, ffprobe_path = self._refresh_ffprobe_path()
         logo_left, logo_top, logo_width, logo_height = self._parse_logo_coordinates()
+        pool_size = self.parallel_jobs_spin.value()
+        # Split the cores between concurrent ffmpeg processes instead of oversubscribing them.
+        ffmpeg_threads = max(1, (os.cpu_count() or 1) // pool_size) if pool_size > 1 else 0
         return ProcessingOptions(
             ffmpeg_path=ffmpeg_path,
-            ffprobe_path=ffprobe_from_ffmpeg(ffmpeg_path),
+            ffprobe_path=ffprobe_path,
             output_folder=self.output_folder_edit.text().strip(),
             save_next_to_input=self.save_next_checkbox.isChecked(),
             overwrite_existing=True,
@@ -420,14 +569,23 @@ class MainWindow(QMainWindow):
             frame_interval_sec=self.interval_spin.value(),
             frame_format=self.image_format_combo.currentText(),
             resize_mode=self.resize_combo.currentText(),
+            hwaccel=self.hwaccel_combo.currentText(),
             logo_path=self.logo_file_edit.text().strip(),
             remove_old_logo=self.delogo_checkbox.isChecked(),
             logo_left=logo_left,
             logo_top=logo_top,
             logo_width=logo_width,
             logo_height=logo_height,
+            pool_size=pool_size,
+            ffmpeg_threads=ffmpeg_threads,
         )
 
+    def _refresh_ffprobe_path(self) -> tuple[str, str]:
+        ffmpeg_path = self.ffmpeg_path_edit.text().strip() or "ffmpeg"
+        if ffmpeg_path != self._ffprobe_cache[0]:
+            self._ffprobe_cache = (ffmpeg_path, ffprobe_from_ffmpeg(ffmpeg_path))
+        return self._ffprobe_cache
+
     def _parse_logo_coordinates(self) -> tuple[int, int, int, int]:
         raw = self.logo_coords_edit.text().strip()
         if not raw:
@@ -455,15 +613,8 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Queue is empty", "Please add at least one video file")
             return
 
-        if self._thread is not None:
-            try:
-                if self._thread.isRunning():
-                    return
-            except RuntimeError:
-                # Underlying Qt object can be deleted after deleteLater().
-                pass
-            self._thread = None
-            self._worker = None
+        if self._worker is not None:
+            return
 
         try:
             options = self._collect_options()
@@ -477,19 +628,14 @@ class MainWindow(QMainWindow):
         self.total_progress.setMaximum(len(self.jobs))
         self.total_progress.setValue(0)
         self.current_progress.setValue(0)
+        self._last_shown.clear()
+        self._running_rows.clear()
 
-        self._thread = QThread(self)
         self._worker = ProcessingWorker(self.jobs, options)
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
         self._worker.signals.log.connect(self._append_log)
         self._worker.signals.job_updated.connect(self._update_job_row)
         self._worker.signals.queue_progress.connect(self._update_queue_progress)
         self._worker.signals.finished.connect(self._on_finished)
-        self._worker.signals.finished.connect(self._thread.quit)
-        self._thread.finished.connect(self._on_thread_finished)
-        self._thread.finished.connect(self._thread.deleteLater)
 
         self.start_btn.setEnabled(False)
         self.frame_replace_tab.start_btn.setEnabled(False)
@@ -499,7 +645,7 @@ class MainWindow(QMainWindow):
         self.pomodoro_tab.generate_cover_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.pomodoro_tab.stop_btn.setEnabled(True)
-        self._thread.start()
+        self._worker.start()
 
     def stop_processing(self) -> None:
         if self._worker:
@@ -507,19 +653,57 @@ class MainWindow(QMainWindow):
             self._append_log("Stop requested")
 
     def _append_log(self, text: str) -> None:
-        self.log_edit.appendPlainText(text)
+        self._log_buffer.append(text)
+        if not self._ui_flush_timer.isActive():
+            self._ui_flush_timer.start()
 
-    def _update_job_row(self, row: int, job: Job) -> None:
-        self.queue_table.item(row, 1).setText(job.status.value)
-        self.queue_table.item(row, 2).setText(str(job.progress))
-        self.queue_table.item(row, 3).setText(job.output_path)
-        self.current_progress.setValue(job.progress)
+    def _flush_ui_updates(self) -> None:
+        if not self._pending_row_updates and not self._log_buffer:
+            self._ui_flush_timer.stop()
+            return
+        self._flush_row_updates()
+        self._flush_log()
+
+    def _flush_log(self) -> None:
+        if not self._log_buffer:
+            return
+        self.log_edit.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+
+    def _update_job_row(self, row: int, status: str, progress: int, output_path: str) -> None:
+        key = (status, progress, output_path)
+        if self._last_shown.get(row) == key:
+            return
+        self._last_shown[row] = key
+        self._pending_row_updates[row] = key
+        if not self._ui_flush_timer.isActive():
+            self._ui_flush_timer.start()
+
+    def _flush_row_updates(self) -> None:
+        if not self._pending_row_updates:
+            return
+        for row, (status, progress, _output_path) in self._pending_row_updates.items():
+            self.queue_model.refresh_row(row)
+            if status == JobStatus.PROCESSING.value:
+                self._running_rows[row] = progress
+            else:
+                self._running_rows.pop(row, None)
+        # Follow the lowest running row so the "current file" bar doesn't hop between
+        # concurrent jobs; once nothing runs, show the last finished row.
+        if self._running_rows:
+            progress = self._running_rows[min(self._running_rows)]
+        else:
+            _status, progress, _output_path = next(reversed(self._pending_row_updates.values()))
+        self.current_progress.setValue(progress)
+        self._pending_row_updates.clear()
 
     def _update_queue_progress(self, done: int, total: int) -> None:
         self.total_progress.setMaximum(max(1, total))
         self.total_progress.setValue(done)
 
     def _on_finished(self, summary: dict) -> None:
+        self._worker = None
+        self._flush_row_updates()
         self.start_btn.setEnabled(True)
         self.frame_replace_tab.start_btn.setEnabled(True)
         self.slide_video_tab.generate_btn.setEnabled(True)
@@ -539,12 +723,9 @@ class MainWindow(QMainWindow):
             message += f"\n\nПервый текст ошибки:\n{first_error.filename}: {first_error.error_message.splitlines()[0]}"
 
         self._append_log(message)
+        self._flush_log()
         QMessageBox.information(self, "Processing finished", message)
 
-    def _on_thread_finished(self) -> None:
-        self._thread = None
-        self._worker = None
-
     def open_output_folder(self) -> None:
         target = self.output_folder_edit.text().strip()
         if not target and self.jobs:
@@ -552,6 +733,30 @@ class MainWindow(QMainWindow):
         if not target:
             return
         path = Path(target)
-        if not path.exists():
-            os.makedirs(path, exist_ok=True)
-        QDesktopServices.openUrl(path.as_uri())
+        if path.exists():
+            QDesktopServices.openUrl(path.as_uri())
+            return
+        # Creating the folder can stall on slow/network drives; do it off the UI thread.
+        # An exception escaping a QRunnable aborts the app, so the outcome is handed back
+        # in a list: "" once the folder exists, the error text if creation failed.
+        outcome: list[str] = []
+
+        def create_folder() -> None:
+            try:
+                os.makedirs(path, exist_ok=True)
+            except OSError as exc:
+                outcome.append(str(exc) or str(path))
+            else:
+                outcome.append("")
+
+        QThreadPool.globalInstance().start(create_folder)
+        self._open_folder_when_ready(path, outcome)
+
+    def _open_folder_when_ready(self, path: Path, outcome: list[str]) -> None:
+        # Poll until makedirs returns, however long a network share or waking disk takes.
+        if not outcome:
+            QTimer.singleShot(50, lambda: self._open_folder_when_ready(path, outcome))
+        elif outcome[0]:
+            self._append_log(f"Could not create output folder: {outcome[0]}")
+        else:
+            QDesktopServices.openUrl(path.as_uri())
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from core.jobs import FrameReplaceJob, Job, PomodoroVideoJob, SlideVideoJob
+
+
+def job_title(job: Job) -> str:
+    if isinstance(job, FrameReplaceJob):
+        return f"[FrameReplace] {job.filename}"
+    if isinstance(job, SlideVideoJob):
+        return f"[SlideVideo] {job.output_name}"
+    if isinstance(job, PomodoroVideoJob):
+        return f"[Pomodoro] {job.output_name}"
+    return job.filename
+
+
+class JobTableModel(QAbstractTableModel):
+    """Queue table over the shared MainWindow.jobs list; cells are read from Job on paint."""
+
+    HEADERS = ["Filename", "Status", "Progress", "Output"]
+
+    def __init__(self, jobs: list[Job], parent=None):
+        super().__init__(parent)
+        self._jobs = jobs
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._jobs)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        job = self._jobs[index.row()]
+        column = index.column()
+        if column == 0:
+            return job_title(job)
+        if column == 1:
+            return job.status.value
+        if column == 2:
+            return str(job.progress)
+        return job.output_path
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def append_job(self, job: Job) -> None:
+        self.append_jobs([job])
+
+    def append_jobs(self, jobs: list[Job]) -> None:
+        if not jobs:
+            return
+        first = len(self._jobs)
+        self.beginInsertRows(QModelIndex(), first, first + len(jobs) - 1)
+        self._jobs.extend(jobs)
+        self.endInsertRows()
+
+    def remove_rows(self, rows: list[int]) -> None:
+        for row in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._jobs.pop(row)
+            self.endRemoveRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._jobs.clear()
+        self.endResetModel()
+
+    def refresh_row(self, row: int) -> None:
+        if 0 <= row < len(self._jobs):
+            self.dataChanged.emit(self.index(row, 1), self.index(row, 3), [Qt.ItemDataRole.DisplayRole])
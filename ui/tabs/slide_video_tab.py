@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import subprocess
 import tempfile
 from pathlib import Path
 from typing import Callable
 
 from PyQt6.QtGui import QDesktopServices
-from PyQt6.QtCore import QUrl
+from PyQt6.QtCore import QProcess, QUrl
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QButtonGroup,
@@ -52,6 +51,12 @@ class SlideVideoTab(QWidget):
         self._options_callback = options_callback
         self._log_callback = log_callback
         self._start_processing_callback = start_processing_callback
+        self._preview_process: QProcess | None = None
+        # Constant cells of a new scene row (audio, duration, start, end, notes) are cloned from these.
+        self._new_row_prototypes = {
+            column: QTableWidgetItem(text)
+            for column, text in ((2, ""), (3, "3.0"), (4, "0.0"), (5, "3.0"), (7, ""))
+        }
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -190,14 +195,11 @@ class SlideVideoTab(QWidget):
         self.scene_table.insertRow(row)
         self.scene_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
         self.scene_table.setItem(row, 1, QTableWidgetItem(slide_path))
-        self.scene_table.setItem(row, 2, QTableWidgetItem(""))
-        self.scene_table.setItem(row, 3, QTableWidgetItem("3.0"))
-        self.scene_table.setItem(row, 4, QTableWidgetItem("0.0"))
-        self.scene_table.setItem(row, 5, QTableWidgetItem("3.0"))
+        for column, prototype in self._new_row_prototypes.items():
+            self.scene_table.setItem(row, column, prototype.clone())
         motion_combo = QComboBox()
         motion_combo.addItems(motion_names())
         self.scene_table.setCellWidget(row, 6, motion_combo)
-        self.scene_table.setItem(row, 7, QTableWidgetItem(""))
 
     def _selected_row(self) -> int:
         rows = sorted({idx.row() for idx in self.scene_table.selectedIndexes()})
@@ -252,7 +254,11 @@ class SlideVideoTab(QWidget):
 
     def _renumber(self) -> None:
         for row in range(self.scene_table.rowCount()):
-            self.scene_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
+            item = self.scene_table.item(row, 0)
+            if item is None:
+                self.scene_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
+            else:
+                item.setText(str(row + 1))
 
     def _refresh_mode_columns(self) -> None:
         duration_mode = self.mode_duration_radio.isChecked()
@@ -303,6 +309,8 @@ class SlideVideoTab(QWidget):
         self.preview_label.setText(f"Preview: {Path(slide).name} | motion={motion}")
 
     def _generate_scene_preview(self) -> None:
+        if self._preview_process is not None:
+            return
         row = self._selected_row()
         if row < 0:
             QMessageBox.warning(self, "Preview", "Выберите сцену для предпросмотра")
@@ -323,33 +331,79 @@ class SlideVideoTab(QWidget):
         width, height = RESOLUTION_PRESETS[self.resolution_combo.currentText()]
         preview_duration = 3.0
 
-        with tempfile.TemporaryDirectory(prefix="slide_preview_") as tmpdir:
-            preview_path = Path(tmpdir) / f"scene_{row+1:03d}_preview.mp4"
-            cmd = build_scene_clip_command(
-                options.ffmpeg_path,
-                Scene(slide_path=slide, motion=motion),
-                str(preview_path),
-                width,
-                height,
-                self.fps_spin.value(),
-                preview_duration,
-                self.scale_mode_combo.currentData(),
-                overwrite=True,
+        tmpdir = tempfile.TemporaryDirectory(prefix="slide_preview_")
+        preview_path = Path(tmpdir.name) / f"scene_{row+1:03d}_preview.mp4"
+        cmd = build_scene_clip_command(
+            options.ffmpeg_path,
+            Scene(slide_path=slide, motion=motion),
+            str(preview_path),
+            width,
+            height,
+            self.fps_spin.value(),
+            preview_duration,
+            self.scale_mode_combo.currentData(),
+            overwrite=True,
+        )
+
+        # QProcess reports completion on the event loop, so the encode doesn't freeze the tab.
+        process = QProcess(self)
+        process.finished.connect(
+            lambda exit_code, exit_status: self._on_scene_preview_finished(
+                process, exit_code, exit_status, tmpdir, preview_path, row
             )
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            if result.returncode != 0 or not preview_path.exists():
-                message = result.stderr.strip() or "Не удалось сгенерировать предпросмотр"
+        )
+        process.errorOccurred.connect(lambda error: self._on_scene_preview_error(process, error, tmpdir))
+        self._preview_process = process
+        self.preview_btn.setEnabled(False)
+        process.start(cmd[0], cmd[1:])
+
+    def _on_scene_preview_finished(
+        self,
+        process: QProcess,
+        exit_code: int,
+        exit_status: QProcess.ExitStatus,
+        tmpdir: tempfile.TemporaryDirectory,
+        preview_path: Path,
+        row: int,
+    ) -> None:
+        try:
+            crashed = exit_status != QProcess.ExitStatus.NormalExit
+            if crashed or exit_code != 0 or not preview_path.exists():
+                stderr = bytes(process.readAllStandardError()).decode(errors="replace")
+                message = stderr.strip() or "Не удалось сгенерировать предпросмотр"
                 QMessageBox.warning(self, "Preview", message)
                 self._log_callback(message)
                 return
 
             saved_preview = Path.cwd() / f"scene_{row+1:03d}_preview.mp4"
             saved_preview.write_bytes(preview_path.read_bytes())
+        finally:
+            self._finish_scene_preview(process, tmpdir)
 
         self._log_callback(f"Preview generated: {saved_preview}")
         self.preview_label.setText(f"Preview: {saved_preview.name}")
         QDesktopServices.openUrl(QUrl.fromLocalFile(str(saved_preview)))
 
+    def _on_scene_preview_error(
+        self,
+        process: QProcess,
+        error: QProcess.ProcessError,
+        tmpdir: tempfile.TemporaryDirectory,
+    ) -> None:
+        # Crashes still emit finished(); only a failed start needs cleanup here.
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        message = f"Не удалось запустить ffmpeg: {process.errorString()}"
+        QMessageBox.warning(self, "Preview", message)
+        self._log_callback(message)
+        self._finish_scene_preview(process, tmpdir)
+
+    def _finish_scene_preview(self, process: QProcess, tmpdir: tempfile.TemporaryDirectory) -> None:
+        tmpdir.cleanup()
+        process.deleteLater()
+        self._preview_process = None
+        self.preview_btn.setEnabled(True)
+
     def _is_timecode_mode(self) -> bool:
         return self.mode_timecodes_radio.isChecked()
 